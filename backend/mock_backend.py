@@ -4,22 +4,51 @@ This provides RESTful APIs for event registration, venue booking, and notificati
 Designed to run on Google Colab with ngrok for public URL access
 """
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List, Optional
-from datetime import datetime, date
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, PrivateAttr, TypeAdapter
+from typing import Any, Dict, List, Optional, Set, Tuple
+from datetime import datetime, date, timezone
+import asyncio
+import collections
+import itertools
+import orjson
 import uvicorn
 from threading import Thread
 import logging
+import os
+import sqlite3
+import sys
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# RESPONSE CLASSES
+# ============================================================================
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback encoder for values orjson does not serialize natively"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# Timestamps are stored as datetime objects and formatted by orjson as RFC 3339 UTC
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module"""
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=_ORJSON_OPTIONS)
+
 app = FastAPI(
     title="Campus Event Management API",
     description="Mock backend for AI agent workshop",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # ============================================================================
@@ -35,6 +64,13 @@ class Event(BaseModel):
     description: str
     max_participants: int
     participants: List[str] = []
+    # Mirror `participants` for O(1) membership and capacity checks; not part of the API schema
+    _participants_set: Set[str] = PrivateAttr(default_factory=set)
+    _count: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._participants_set = set(self.participants)
+        self._count = len(self.participants)
 
 class Venue(BaseModel):
     venue_id: str
@@ -42,6 +78,14 @@ class Venue(BaseModel):
     capacity: int
     facilities: List[str]
     bookings: List[dict] = []
+    # Indexes over `bookings` for O(1) availability lookups; not part of the API schema
+    _booking_index: Dict[Tuple[str, str], dict] = PrivateAttr(default_factory=dict)
+    _bookings_by_date: Dict[str, List[dict]] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        for b in self.bookings:
+            self._booking_index.setdefault((b["date"], b["time_slot"]), b)
+            self._bookings_by_date.setdefault(b["date"], []).append(b)
 
 class RegistrationRequest(BaseModel):
     student_id: str
@@ -152,14 +196,147 @@ venues_db = {
     )
 }
 
-notifications_log = []
+# Bounded so a long-running server keeps only the most recent notifications
+NOTIFICATIONS_LOG_MAXLEN = 10_000
+notifications_log = collections.deque(maxlen=NOTIFICATIONS_LOG_MAXLEN)
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+# Serialized JSON bodies for the read endpoints. The data only changes through
+# the registration and booking endpoints, which drop the affected entries.
+_events_cache: Optional[bytes] = None
+_venues_cache: Optional[bytes] = None
+_event_cache: Dict[str, bytes] = {}
+_venue_cache: Dict[str, bytes] = {}
+
+# Snapshots of events_db/venues_db values so list endpoints don't copy the dicts
+# on every call; rebuilt whenever the dicts themselves are repopulated
+_events_snapshot: Tuple[Event, ...] = tuple(events_db.values())
+_venues_snapshot: Tuple[Venue, ...] = tuple(venues_db.values())
+
+# Serialize model sequences straight to JSON without building intermediate dicts
+_events_list_adapter = TypeAdapter(Tuple[Event, ...])
+_venues_list_adapter = TypeAdapter(Tuple[Venue, ...])
+
+# Leave out empty/default fields (e.g. `participants: []`) to keep responses small
+_RESPONSE_DUMP_OPTIONS = {"exclude_none": True, "exclude_defaults": True}
+
+def _invalidate_event(event_id: str):
+    """Drop cached bodies that include the given event"""
+    global _events_cache
+    _events_cache = None
+    _event_cache.pop(event_id, None)
+
+def _invalidate_venue(venue_id: str):
+    """Drop cached bodies that include the given venue"""
+    global _venues_cache
+    _venues_cache = None
+    _venue_cache.pop(venue_id, None)
+
+def _refresh_snapshots():
+    """Rebuild the event and venue snapshots after events_db/venues_db change"""
+    global _events_snapshot, _venues_snapshot
+    _events_snapshot = tuple(events_db.values())
+    _venues_snapshot = tuple(venues_db.values())
+
+def _invalidate_all():
+    """Drop every cached event and venue body"""
+    global _events_cache, _venues_cache
+    _events_cache = None
+    _venues_cache = None
+    _event_cache.clear()
+    _venue_cache.clear()
+
+def _json_bytes_response(body: bytes) -> Response:
+    """Wrap an already-serialized JSON body in a response"""
+    return Response(content=body, media_type="application/json")
+
+# ============================================================================
+# PERSISTENCE
+# ============================================================================
+
+# SQLite (in WAL mode) is the source of truth shared by all workers and kept
+# across restarts; events_db/venues_db above are the seed data and an in-memory
+# mirror that serves reads. Delete the database file to reset to the seed data.
+DB_PATH = os.environ.get("CAMPUS_DB_PATH", "events.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (event_id TEXT PRIMARY KEY, json BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS venues (venue_id TEXT PRIMARY KEY, json BLOB NOT NULL);
+CREATE TABLE IF NOT EXISTS participants (
+    event_id TEXT NOT NULL,
+    student_id TEXT NOT NULL,
+    PRIMARY KEY (event_id, student_id)
+);
+CREATE TABLE IF NOT EXISTS bookings (
+    venue_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    time_slot TEXT NOT NULL,
+    json BLOB NOT NULL,
+    PRIMARY KEY (venue_id, date, time_slot)
+);
+"""
+
+# One autocommit connection per process; every statement below runs as its own transaction
+_db = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False)
+_db.execute("PRAGMA journal_mode=WAL")
+_db.execute("PRAGMA synchronous=NORMAL")
+_db.executescript(_SCHEMA)
+_db.executemany(
+    "INSERT OR IGNORE INTO events (event_id, json) VALUES (?, ?)",
+    [(e.event_id, e.model_dump_json(exclude={"participants"})) for e in events_db.values()]
+)
+_db.executemany(
+    "INSERT OR IGNORE INTO venues (venue_id, json) VALUES (?, ?)",
+    [(v.venue_id, v.model_dump_json(exclude={"bookings"})) for v in venues_db.values()]
+)
+
+_db_data_version: Optional[int] = None
+
+def _load_from_db():
+    """Rebuild events_db and venues_db from the database"""
+    participants: Dict[str, List[str]] = {}
+    for event_id, student_id in _db.execute("SELECT event_id, student_id FROM participants ORDER BY rowid"):
+        participants.setdefault(event_id, []).append(student_id)
+    
+    bookings: Dict[str, List[dict]] = {}
+    for venue_id, booking_json in _db.execute("SELECT venue_id, json FROM bookings ORDER BY rowid"):
+        bookings.setdefault(venue_id, []).append(orjson.loads(booking_json))
+    
+    events = {}
+    for event_id, event_json in _db.execute("SELECT event_id, json FROM events ORDER BY rowid"):
+        events[event_id] = Event(**orjson.loads(event_json), participants=participants.get(event_id, []))
+    
+    venues = {}
+    for venue_id, venue_json in _db.execute("SELECT venue_id, json FROM venues ORDER BY rowid"):
+        venues[venue_id] = Venue(**orjson.loads(venue_json), bookings=bookings.get(venue_id, []))
+    
+    events_db.clear()
+    events_db.update(events)
+    venues_db.clear()
+    venues_db.update(venues)
+    _refresh_snapshots()
+    _invalidate_all()
+
+def _sync_from_db():
+    """Reload the in-memory mirror if another connection has committed since the last load"""
+    global _db_data_version
+    # data_version only changes for commits made by *other* connections (i.e. other workers)
+    version = _db.execute("PRAGMA data_version").fetchone()[0]
+    if version != _db_data_version:
+        _load_from_db()
+        _db_data_version = version
+
+_sync_from_db()
 
 # ============================================================================
 # EVENTS ENDPOINTS
 # ============================================================================
 
 @app.get("/")
-def root():
+async def root():
     """Health check endpoint"""
     return {
         "status": "healthy",
@@ -172,44 +349,76 @@ def root():
         }
     }
 
-@app.get("/events", response_model=List[Event])
-def list_events():
+@app.get("/events", responses={200: {"model": List[Event]}})
+async def list_events():
     """Get list of all events"""
+    global _events_cache
+    _sync_from_db()
     logger.info("Fetching all events")
-    return list(events_db.values())
+    if _events_cache is None:
+        _events_cache = _events_list_adapter.dump_json(_events_snapshot, **_RESPONSE_DUMP_OPTIONS)
+    return _json_bytes_response(_events_cache)
 
-@app.get("/events/{event_id}", response_model=Event)
-def get_event(event_id: str):
+@app.get("/events/{event_id}", responses={200: {"model": Event}})
+async def get_event(event_id: str):
     """Get details of a specific event"""
+    _sync_from_db()
     if event_id not in events_db:
         raise HTTPException(status_code=404, detail=f"Event '{event_id}' not found")
     logger.info(f"Fetching event: {event_id}")
-    return events_db[event_id]
+    body = _event_cache.get(event_id)
+    if body is None:
+        body = _event_cache[event_id] = events_db[event_id].model_dump_json(**_RESPONSE_DUMP_OPTIONS).encode()
+    return _json_bytes_response(body)
 
 @app.post("/events/{event_id}/register")
-def register_for_event(event_id: str, registration: RegistrationRequest):
+async def register_for_event(event_id: str, registration: RegistrationRequest):
     """Register a student for an event"""
+    _sync_from_db()
     if event_id not in events_db:
         raise HTTPException(status_code=404, detail=f"Event '{event_id}' not found")
     
     event = events_db[event_id]
     
     # Check if already registered
-    if registration.student_id in event.participants:
+    if registration.student_id in event._participants_set:
         return {
             "success": False,
             "message": f"Student {registration.student_name} is already registered for {event.name}"
         }
     
     # Check capacity
-    if len(event.participants) >= event.max_participants:
+    if event._count >= event.max_participants:
+        return {
+            "success": False,
+            "message": f"Event {event.name} is full (max capacity: {event.max_participants})"
+        }
+    
+    # Register student; the capacity condition is re-checked inside the insert so
+    # concurrent registrations from other workers cannot overfill the event
+    cursor = _db.execute(
+        "INSERT OR IGNORE INTO participants (event_id, student_id) "
+        "SELECT ?, ? WHERE (SELECT COUNT(*) FROM participants WHERE event_id = ?) < ?",
+        (event_id, registration.student_id, event_id, event.max_participants)
+    )
+    if cursor.rowcount == 0:
+        # Another worker registered this student or filled the event first
+        _sync_from_db()
+        event = events_db[event_id]
+        if registration.student_id in event._participants_set:
+            return {
+                "success": False,
+                "message": f"Student {registration.student_name} is already registered for {event.name}"
+            }
         return {
             "success": False,
             "message": f"Event {event.name} is full (max capacity: {event.max_participants})"
         }
     
-    # Register student
+    event._participants_set.add(registration.student_id)
+    event._count += 1
     event.participants.append(registration.student_id)
+    _invalidate_event(event_id)
     logger.info(f"Registered student {registration.student_id} for event {event_id}")
     
     return {
@@ -220,25 +429,40 @@ def register_for_event(event_id: str, registration: RegistrationRequest):
             "date": event.date,
             "time": event.time,
             "venue": event.venue,
-            "participants_count": len(event.participants)
+            "participants_count": event._count
         }
     }
 
 @app.delete("/events/{event_id}/register/{student_id}")
-def unregister_from_event(event_id: str, student_id: str):
+async def unregister_from_event(event_id: str, student_id: str):
     """Unregister a student from an event"""
+    _sync_from_db()
     if event_id not in events_db:
         raise HTTPException(status_code=404, detail=f"Event '{event_id}' not found")
     
     event = events_db[event_id]
     
-    if student_id not in event.participants:
+    if student_id not in event._participants_set:
+        return {
+            "success": False,
+            "message": f"Student {student_id} is not registered for {event.name}"
+        }
+    
+    cursor = _db.execute(
+        "DELETE FROM participants WHERE event_id = ? AND student_id = ?", (event_id, student_id)
+    )
+    if cursor.rowcount == 0:
+        # Another worker unregistered this student first
+        _sync_from_db()
         return {
             "success": False,
             "message": f"Student {student_id} is not registered for {event.name}"
         }
     
+    event._participants_set.discard(student_id)
+    event._count -= 1
     event.participants.remove(student_id)
+    _invalidate_event(event_id)
     logger.info(f"Unregistered student {student_id} from event {event_id}")
     
     return {
@@ -247,8 +471,9 @@ def unregister_from_event(event_id: str, student_id: str):
     }
 
 @app.get("/events/{event_id}/participants")
-def get_event_participants(event_id: str):
+async def get_event_participants(event_id: str):
     """Get list of participants for an event"""
+    _sync_from_db()
     if event_id not in events_db:
         raise HTTPException(status_code=404, detail=f"Event '{event_id}' not found")
     
@@ -258,7 +483,7 @@ def get_event_participants(event_id: str):
     return {
         "event_id": event_id,
         "event_name": event.name,
-        "participant_count": len(event.participants),
+        "participant_count": event._count,
         "participants": event.participants
     }
 
@@ -266,58 +491,67 @@ def get_event_participants(event_id: str):
 # VENUES ENDPOINTS
 # ============================================================================
 
-@app.get("/venues", response_model=List[Venue])
-def list_venues():
+@app.get("/venues", responses={200: {"model": List[Venue]}})
+async def list_venues():
     """Get list of all venues"""
+    global _venues_cache
+    _sync_from_db()
     logger.info("Fetching all venues")
-    return list(venues_db.values())
+    if _venues_cache is None:
+        _venues_cache = _venues_list_adapter.dump_json(_venues_snapshot, **_RESPONSE_DUMP_OPTIONS)
+    return _json_bytes_response(_venues_cache)
 
-@app.get("/venues/{venue_id}", response_model=Venue)
-def get_venue(venue_id: str):
+@app.get("/venues/{venue_id}", responses={200: {"model": Venue}})
+async def get_venue(venue_id: str):
     """Get details of a specific venue"""
+    _sync_from_db()
     if venue_id not in venues_db:
         raise HTTPException(status_code=404, detail=f"Venue '{venue_id}' not found")
     logger.info(f"Fetching venue: {venue_id}")
-    return venues_db[venue_id]
+    body = _venue_cache.get(venue_id)
+    if body is None:
+        body = _venue_cache[venue_id] = venues_db[venue_id].model_dump_json(**_RESPONSE_DUMP_OPTIONS).encode()
+    return _json_bytes_response(body)
 
 @app.get("/venues/{venue_id}/availability")
-def check_venue_availability(venue_id: str, date: str, time_slot: Optional[str] = None):
+async def check_venue_availability(venue_id: str, date: str, time_slot: Optional[str] = None):
     """Check if a venue is available on a specific date/time"""
+    _sync_from_db()
     if venue_id not in venues_db:
         raise HTTPException(status_code=404, detail=f"Venue '{venue_id}' not found")
     
     venue = venues_db[venue_id]
     
-    # Check bookings for the date
-    bookings_on_date = [b for b in venue.bookings if b["date"] == date]
-    
     if time_slot:
         # Check specific time slot
-        conflicting_bookings = [b for b in bookings_on_date if b["time_slot"] == time_slot]
-        available = len(conflicting_bookings) == 0
+        existing = venue._booking_index.get((date, time_slot))
+        conflicting_bookings = [existing] if existing is not None else []
+        available = existing is None
         
-        return {
+        return ORJSONResponse(content={
             "venue_id": venue_id,
             "venue_name": venue.name,
             "date": date,
             "time_slot": time_slot,
             "available": available,
             "existing_bookings": conflicting_bookings
-        }
+        })
     else:
         # Return all bookings for the date
-        return {
+        bookings_on_date = venue._bookings_by_date.get(date, [])
+        return ORJSONResponse(content={
             "venue_id": venue_id,
             "venue_name": venue.name,
             "date": date,
             "available_slots": 8,  # Assume 8 time slots per day
             "booked_slots": len(bookings_on_date),
             "bookings": bookings_on_date
-        }
+        })
 
 @app.post("/venues/{venue_id}/book")
-def book_venue(venue_id: str, booking: BookingRequest):
+async def book_venue(venue_id: str, booking: BookingRequest):
     """Book a venue for a specific date and time"""
+    _sync_from_db()
     if venue_id not in venues_db:
         raise HTTPException(status_code=404, detail=f"Venue '{venue_id}' not found")
     
@@ -331,17 +565,15 @@ def book_venue(venue_id: str, booking: BookingRequest):
         }
     
     # Check availability
-    conflicting_bookings = [
-        b for b in venue.bookings 
-        if b["date"] == booking.date and b["time_slot"] == booking.time_slot
-    ]
+    slot = (booking.date, booking.time_slot)
+    existing_booking = venue._booking_index.get(slot)
     
-    if conflicting_bookings:
-        return {
+    if existing_booking is not None:
+        return ORJSONResponse(content={
             "success": False,
             "message": f"Venue {venue.name} is already booked for {booking.date} at {booking.time_slot}",
-            "existing_booking": conflicting_bookings[0]
-        }
+            "existing_booking": existing_booking
+        })
     
     # Create booking
     new_booking = {
@@ -350,10 +582,30 @@ def book_venue(venue_id: str, booking: BookingRequest):
         "time_slot": booking.time_slot,
         "purpose": booking.purpose,
         "expected_attendees": booking.expected_attendees,
-        "booked_at": datetime.now().isoformat()
+        "booked_at": datetime.now(timezone.utc)
     }
     
+    # The (venue_id, date, time_slot) primary key rejects a slot booked by another worker
+    cursor = _db.execute(
+        "INSERT OR IGNORE INTO bookings (venue_id, date, time_slot, json) VALUES (?, ?, ?, ?)",
+        (venue_id, booking.date, booking.time_slot, orjson.dumps(new_booking, option=_ORJSON_OPTIONS))
+    )
+    if cursor.rowcount == 0:
+        _sync_from_db()
+        row = _db.execute(
+            "SELECT json FROM bookings WHERE venue_id = ? AND date = ? AND time_slot = ?",
+            (venue_id, booking.date, booking.time_slot)
+        ).fetchone()
+        return ORJSONResponse(content={
+            "success": False,
+            "message": f"Venue {venue.name} is already booked for {booking.date} at {booking.time_slot}",
+            "existing_booking": orjson.loads(row[0]) if row else None
+        })
+    
     venue.bookings.append(new_booking)
+    venue._booking_index[slot] = new_booking
+    venue._bookings_by_date.setdefault(booking.date, []).append(new_booking)
+    _invalidate_venue(venue_id)
     logger.info(f"Booked venue {venue_id} for {booking.club_name} on {booking.date}")
     
     return {
@@ -373,18 +625,30 @@ def book_venue(venue_id: str, booking: BookingRequest):
 # NOTIFICATIONS ENDPOINTS
 # ============================================================================
 
+async def _send_to_recipient(recipient: str, notification_record: dict):
+    """Deliver a notification to a single recipient (mocked as a log line)"""
+    logger.debug(f"Delivered notification for event {notification_record['event_id']} to {recipient}")
+
+async def _deliver(notification_record: dict, recipients: List[str]):
+    """Fan a notification out to all recipients concurrently, then log it"""
+    await asyncio.gather(*[_send_to_recipient(r, notification_record) for r in recipients])
+    notifications_log.append(notification_record)
+    logger.info(f"Sent notification to {len(recipients)} recipients for event {notification_record['event_id']}")
+
 @app.post("/notifications/send")
-def send_notification(notification: NotificationRequest):
+async def send_notification(notification: NotificationRequest, background_tasks: BackgroundTasks):
     """Send notification to event participants or students"""
     
     # Determine recipients
     recipients = []
     
     if notification.recipient_type == "all_participants":
+        _sync_from_db()
         if notification.event_id not in events_db:
             raise HTTPException(status_code=404, detail=f"Event '{notification.event_id}' not found")
         event = events_db[notification.event_id]
-        recipients = event.participants
+        # Snapshot so later (un)registrations don't change who this notification went to
+        recipients = list(event.participants)
     elif notification.recipient_type == "specific_students":
         if not notification.recipient_ids:
             raise HTTPException(status_code=400, detail="recipient_ids required for specific_students")
@@ -401,9 +665,9 @@ def send_notification(notification: NotificationRequest):
             "message": "No recipients found for this notification"
         }
     
-    # Log notification
+    # Queue delivery; the response is returned without waiting for it
     notification_record = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(timezone.utc),
         "event_id": notification.event_id,
         "message": notification.message,
         "recipient_type": notification.recipient_type,
@@ -411,10 +675,9 @@ def send_notification(notification: NotificationRequest):
         "recipients": recipients
     }
     
-    notifications_log.append(notification_record)
-    logger.info(f"Sent notification to {len(recipients)} recipients for event {notification.event_id}")
+    background_tasks.add_task(_deliver, notification_record, recipients)
     
-    return {
+    return ORJSONResponse(content={
         "success": True,
         "message": f"Notification sent to {len(recipients)} recipients",
         "details": {
@@ -422,27 +685,54 @@ def send_notification(notification: NotificationRequest):
             "recipient_count": len(recipients),
             "sent_at": notification_record["timestamp"]
         }
-    }
+    })
 
 @app.get("/notifications/log")
-def get_notifications_log():
-    """Get history of all sent notifications"""
+async def get_notifications_log(limit: Optional[int] = Query(None, ge=0), offset: int = Query(0, ge=0)):
+    """Get history of sent notifications, most recent first"""
     logger.info(f"Fetching notifications log ({len(notifications_log)} notifications)")
-    return {
+    stop = offset + limit if limit is not None else None
+    return ORJSONResponse(content={
         "total_notifications": len(notifications_log),
-        "notifications": notifications_log
-    }
+        "offset": offset,
+        "limit": limit,
+        "notifications": list(itertools.islice(reversed(notifications_log), offset, stop))
+    })
 
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
-def run_server(port: int = 8000):
-    """Run the FastAPI server"""
-    uvicorn.run(app, host="0.0.0.0", port=port, log_level="info")
+# uvloop is not available on Windows; elsewhere require it (and httptools) so a
+# missing `uvicorn[standard]` install fails loudly instead of silently falling back
+UVICORN_LOOP = "auto" if sys.platform == "win32" else "uvloop"
+UVICORN_HTTP = "httptools"
+
+def run_server(port: int = 8000, workers: int = 1):
+    """
+    Run the FastAPI server
+    
+    With workers > 1 each worker is a separate process. Registrations and
+    bookings are shared through the SQLite database, but notifications_log
+    is kept per process, so each worker only reports what it sent itself.
+    """
+    if workers > 1:
+        # Multiple workers need an import string so each process can load the app itself
+        uvicorn.run(
+            "mock_backend:app",
+            app_dir=os.path.dirname(os.path.abspath(__file__)),
+            host="0.0.0.0",
+            port=port,
+            workers=workers,
+            log_level="info",
+            loop=UVICORN_LOOP,
+            http=UVICORN_HTTP
+        )
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=port, log_level="info", loop=UVICORN_LOOP, http=UVICORN_HTTP)
 
 def run_in_thread(port: int = 8000):
-    """Run server in background thread (useful for Colab)"""
+    """Run server in background thread (useful for Colab, single worker only)"""
     thread = Thread(target=run_server, args=(port,), daemon=True)
     thread.start()
     logger.info(f"Server started in background on port {port}")
@@ -453,12 +743,14 @@ def run_in_thread(port: int = 8000):
 # ============================================================================
 
 if __name__ == "__main__":
-    import sys
-    
     port = 8000
     if len(sys.argv) > 1:
         port = int(sys.argv[1])
     
+    workers = 1
+    if len(sys.argv) > 2:
+        workers = int(sys.argv[2])
+    
     print(f"""
     ╔══════════════════════════════════════════════════════════╗
     ║   Campus Event Management API - Mock Backend           ║
@@ -469,4 +761,4 @@ if __name__ == "__main__":
     ╚══════════════════════════════════════════════════════════╝
     """)
     
-    run_server(port)
+    run_server(port, workers=workers)
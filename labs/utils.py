@@ -3,15 +3,28 @@ Utility functions for the Campus Event Management Agent Workshop.
 
 This module provides helper functions for:
 - Converting Python functions to tool schemas
-- Converting agent responses to trace format for evaluation
+- Converting agent responses to trace format for evaluation (as a list or lazily)
 """
 
+import functools
 import inspect
-import json
-from typing import Any, Callable, Dict, List, get_type_hints, get_origin, get_args
+import orjson
+from typing import Any, Callable, Dict, Iterator, List, get_type_hints, get_origin, get_args
 from datetime import datetime
 
 
+# Map Python types to JSON schema types
+_TYPE_MAPPING = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+}
+
+
+@functools.lru_cache(maxsize=256)
 def function_to_tool_schema(func: Callable) -> Dict[str, Any]:
     """
     Convert a Python function to a tool schema compatible with Microsoft Agents Framework.
@@ -26,7 +39,9 @@ def function_to_tool_schema(func: Callable) -> Dict[str, Any]:
         func: The Python function to convert
         
     Returns:
-        A dictionary representing the tool schema
+        A dictionary representing the tool schema. Schemas are cached per
+        function, so the same dictionary is returned on repeated calls; copy
+        it before modifying.
         
     Example:
         >>> from typing import Annotated
@@ -49,7 +64,7 @@ def function_to_tool_schema(func: Callable) -> Dict[str, Any]:
     description = inspect.getdoc(func) or f"Execute {func.__name__}"
     
     # Get type hints (handles Annotated types)
-    type_hints = get_type_hints(func, include_extras=True)
+    type_hints = _get_type_hints(func)
     
     properties = {}
     required = []
@@ -107,6 +122,31 @@ def function_to_tool_schema(func: Callable) -> Dict[str, Any]:
     return tool_schema
 
 
+def _get_type_hints(func: Callable) -> Dict[str, Any]:
+    """
+    Get a function's type hints, storing them on the function after the first call.
+    
+    get_type_hints re-resolves forward references every time it is called, so
+    the result is kept in ``func.__tool_type_hints_cache__``. Callables that
+    don't accept attributes (e.g. bound methods) are resolved on every call.
+    
+    Args:
+        func: The function to inspect
+        
+    Returns:
+        The function's type hints, including Annotated metadata
+    """
+    type_hints = getattr(func, "__tool_type_hints_cache__", None)
+    if type_hints is None:
+        type_hints = get_type_hints(func, include_extras=True)
+        try:
+            func.__tool_type_hints_cache__ = type_hints
+        except AttributeError:
+            pass
+    return type_hints
+
+
+@functools.lru_cache(maxsize=64)
 def _python_type_to_json_type(python_type: Any) -> str:
     """
     Map Python types to JSON schema types.
@@ -117,18 +157,9 @@ def _python_type_to_json_type(python_type: Any) -> str:
     Returns:
         The corresponding JSON schema type as a string
     """
-    type_mapping = {
-        str: "string",
-        int: "integer",
-        float: "number",
-        bool: "boolean",
-        list: "array",
-        dict: "object",
-    }
-    
     # Handle basic types
-    if python_type in type_mapping:
-        return type_mapping[python_type]
+    if python_type in _TYPE_MAPPING:
+        return _TYPE_MAPPING[python_type]
     
     # Handle typing generics
     origin = get_origin(python_type)
@@ -141,60 +172,42 @@ def _python_type_to_json_type(python_type: Any) -> str:
     return "string"
 
 
-def convert_agent_response_to_trace(response) -> List[Dict[str, Any]]:
+def iter_agent_response_trace(response) -> Iterator[Dict[str, Any]]:
     """
-    Convert a Microsoft Agent Framework AgentRunResponse to a standardized trace format.
+    Lazily convert a Microsoft Agent Framework AgentRunResponse to trace entries.
     
-    This format is compatible with Azure AI Evaluation's TaskAdherenceEvaluator,
-    which requires traces to assess whether the agent followed the expected workflow.
+    Yields the same entries as convert_agent_response_to_trace, one message at a
+    time, so long runs can be fed to evaluators without building the full trace.
     
     Args:
         response: AgentRunResponse object or dict from agent.run()
         
-    Returns:
-        A list of trace entries, each representing a message in the conversation
+    Yields:
+        Trace entries, each representing a message in the conversation
         
     Example:
         >>> response = await agent.run("Register me for AI Workshop")
-        >>> trace = convert_agent_response_to_trace(response)
-        >>> # Use trace with TaskAdherenceEvaluator
+        >>> for entry in iter_agent_response_trace(response):
+        ...     print(entry["role"], entry["content"])
     """
     # Convert to dict if it's an object
     response_dict = response if isinstance(response, dict) else response.to_dict()
     
-    trace = []
     created_at = response_dict.get("created_at")
     run_id = response_dict.get("response_id")
+    get_builder = _CONTENT_BUILDERS.get
     
     for msg in response_dict.get("messages", []):
         role = msg.get("role", {}).get("value")
+        contents = msg.get("contents", [])
         content_list = []
+        append = content_list.append
         
-        for content in msg.get("contents", []):
-            ctype = content.get("type")
-            
-            if ctype == "function_call":
-                # Assistant initiated a tool call
-                content_list.append({
-                    "type": "tool_call",
-                    "tool_call_id": content.get("call_id"),
-                    "name": content.get("name"),
-                    "arguments": json.loads(content.get("arguments", "{}"))
-                })
-            
-            elif ctype == "function_result":
-                # Tool returned a result
-                content_list.append({
-                    "type": "tool_result",
-                    "tool_result": content.get("result")
-                })
-            
-            elif ctype == "text":
-                # Normal assistant message
-                content_list.append({
-                    "type": "text",
-                    "text": content.get("text")
-                })
+        for content in contents:
+            # Content types without a builder (e.g. usage) are not traced
+            build = get_builder(content.get("type"))
+            if build is not None:
+                append(build(content))
         
         # Construct final trace entry
         trace_entry = {
@@ -205,15 +218,66 @@ def convert_agent_response_to_trace(response) -> List[Dict[str, Any]]:
         }
         
         # Optional: add tool_call_id for tool messages
-        if role == "tool" and content_list and "tool_call_id" not in trace_entry:
-            first_content = content_list[0]
+        if role == "tool" and content_list:
             # Try to link tool result with call id
-            if msg.get("contents"):
-                trace_entry["tool_call_id"] = msg["contents"][0].get("call_id")
+            trace_entry["tool_call_id"] = contents[0].get("call_id")
         
-        trace.append(trace_entry)
+        yield trace_entry
+
+
+def convert_agent_response_to_trace(response) -> List[Dict[str, Any]]:
+    """
+    Convert a Microsoft Agent Framework AgentRunResponse to a standardized trace format.
     
-    return trace
+    This format is compatible with Azure AI Evaluation's TaskAdherenceEvaluator,
+    which requires traces to assess whether the agent followed the expected workflow.
+    
+    Args:
+        response: AgentRunResponse object or dict from agent.run()
+        
+    Returns:
+        A list of trace entries, each representing a message in the conversation
+        
+    Example:
+        >>> response = await agent.run("Register me for AI Workshop")
+        >>> trace = convert_agent_response_to_trace(response)
+        >>> # Use trace with TaskAdherenceEvaluator
+    """
+    return list(iter_agent_response_trace(response))
+
+
+def _build_tool_call(content: Dict[str, Any]) -> Dict[str, Any]:
+    """Assistant initiated a tool call"""
+    return {
+        "type": "tool_call",
+        "tool_call_id": content.get("call_id"),
+        "name": content.get("name"),
+        "arguments": orjson.loads(content.get("arguments") or b"{}")
+    }
+
+
+def _build_tool_result(content: Dict[str, Any]) -> Dict[str, Any]:
+    """Tool returned a result"""
+    return {
+        "type": "tool_result",
+        "tool_result": content.get("result")
+    }
+
+
+def _build_text(content: Dict[str, Any]) -> Dict[str, Any]:
+    """Normal assistant message"""
+    return {
+        "type": "text",
+        "text": content.get("text")
+    }
+
+
+# Agent Framework content type -> builder for its trace form
+_CONTENT_BUILDERS = {
+    "function_call": _build_tool_call,
+    "function_result": _build_tool_result,
+    "text": _build_text,
+}
 
 
 def print_agent_response(response, show_details: bool = False):
@@ -248,7 +312,7 @@ def print_agent_response(response, show_details: bool = False):
                 if content.get("type") == "function_call":
                     tool_calls.append({
                         "name": content.get("name"),
-                        "arguments": json.loads(content.get("arguments", "{}"))
+                        "arguments": orjson.loads(content.get("arguments") or b"{}")
                     })
         
         if tool_calls:
@@ -267,5 +331,6 @@ def print_agent_response(response, show_details: bool = False):
 __all__ = [
     'function_to_tool_schema',
     'convert_agent_response_to_trace',
+    'iter_agent_response_trace',
     'print_agent_response'
 ]